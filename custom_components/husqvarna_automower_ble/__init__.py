@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from automower_ble.mower import Mower
@@ -11,10 +12,9 @@ from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_CLIENT_ID, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN, MANUFACTURER
-from .coordinator import Coordinator
+from .const import DOMAIN
+from .coordinator import Coordinator, async_negotiate_mtu
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,30 +30,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     mower = Mower(channel_id, address)
 
-    await close_stale_connections_by_address(address)
+    stale_connections = asyncio.create_task(
+        close_stale_connections_by_address(address)
+    )
 
     LOGGER.debug("connecting to %s with channel ID %s", address, str(channel_id))
-    device = bluetooth.async_ble_device_from_address(
-        hass, address, connectable=True
-    ) or await get_device(address)
+    try:
+        device = bluetooth.async_ble_device_from_address(
+            hass, address, connectable=True
+        ) or await get_device(address)
+    finally:
+        await stale_connections
     if not await mower.connect(device):
         return False
+    await async_negotiate_mtu(mower)
     LOGGER.debug("connected and paired")
 
     model = await mower.get_model()
     LOGGER.info("Connected to Automower: %s", model)
 
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, str(address) + str(channel_id))},
-        manufacturer=MANUFACTURER,
-        model=model,
-    )
+    coordinator = Coordinator(hass, LOGGER, mower, address, channel_id, model)
 
-    coordinator = Coordinator(hass, LOGGER, mower, device_info, address, model)
+    entry.async_on_unload(
+        bluetooth.async_track_unavailable(
+            hass, coordinator.async_handle_unavailable, address, connectable=True
+        )
+    )
+    entry.async_on_unload(
+        bluetooth.async_register_callback(
+            hass,
+            coordinator.async_handle_advertisement,
+            bluetooth.BluetoothCallbackMatcher(address=address, connectable=True),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+    )
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    await coordinator.async_refresh()
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+    )
 
     return True
 
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime,timedelta
 import logging
-from typing import Any
+import random
+from typing import Any, NamedTuple
 
 from automower_ble.mower import Mower
-from automower_ble.protocol import MowerActivity
+from automower_ble.protocol import MowerActivity, MowerState
 from bleak import BleakError
+from bleak.backends.device import BLEDevice
 from bleak_retry_connector import close_stale_connections_by_address
 
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -20,12 +24,51 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
+from .const import DOMAIN, MANUFACTURER
+
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=60)
+DOCKED_SCAN_INTERVAL = timedelta(seconds=300)
+ACTIVE_SCAN_INTERVAL = timedelta(seconds=30)
+BACKOFF_INITIAL_DELAY = 10
+BACKOFF_MAX_DELAY = 600
+PARKED_DISCONNECT_DELAY = timedelta(minutes=15)
+DEFAULT_MTU_SIZE = 20
+MAX_MTU_SIZE = 247
+
+
+async def async_negotiate_mtu(mower: Mower) -> None:
+    """Size request chunks to the ATT MTU negotiated for the connection.
+
+    automower_ble writes requests in chunks of MTU_SIZE - 3 bytes. Only the
+    BlueZ backend can report the negotiated MTU, others keep the default.
+    """
+    backend = mower.client._backend
+    acquire_mtu = getattr(backend, "_acquire_mtu", None)
+    if acquire_mtu is None:
+        return
+
+    try:
+        await acquire_mtu()
+    except Exception as err:
+        # Not every adapter supports acquiring the MTU
+        _LOGGER.debug("Unable to acquire MTU: %s", err)
+        return
+
+    mower.MTU_SIZE = min(backend._mtu_size, MAX_MTU_SIZE)
+    _LOGGER.debug("Using MTU %d", mower.MTU_SIZE)
+
 
+class MowerData(NamedTuple):
+    """Status read from the mower on each poll."""
 
-class Coordinator(DataUpdateCoordinator[dict[str, bytes]]):
+    battery_level: int
+    activity: MowerActivity
+    state: MowerState
+
+
+class Coordinator(DataUpdateCoordinator[MowerData]):
     """Class to manage fetching data."""
 
     def __init__(
@@ -33,8 +76,8 @@ class Coordinator(DataUpdateCoordinator[dict[str, bytes]]):
         hass: HomeAssistant,
         logger: logging.Logger,
         mower: Mower,
-        device_info: DeviceInfo,
         address: str,
+        channel_id: int,
         model: str,
     ) -> None:
         """Initialize global data updater."""
@@ -47,65 +90,257 @@ class Coordinator(DataUpdateCoordinator[dict[str, bytes]]):
         self.address = address
         self.model = model
         self.mower = mower
-        self.device_info = device_info
+        self.base_unique_id = f"automower{model}_{address}"
+        self.device_identifier = f"{address}{channel_id}"
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.device_identifier)},
+            manufacturer=MANUFACTURER,
+            model=model,
+        )
+        self._io_lock = asyncio.Lock()
+        self._connections = 0
+        self._command_lock = asyncio.Lock()
+        self._pending_command: str | None = None
+        self._out_of_range = False
+        self._retry_count = 0
+        self._ble_device: BLEDevice | None = None
+        self._parked_since: datetime | None = None
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and any connection."""
         _LOGGER.debug("Shutdown")
         await super().async_shutdown()
+        self._invalidate_ble_device()
         if self.mower.is_connected():
             await self.mower.disconnect()
 
+    @callback
+    def async_handle_unavailable(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Remember that the mower has stopped advertising."""
+        _LOGGER.debug("Mower is out of range")
+        self._out_of_range = True
+
+    @callback
+    def async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Poll right away when the mower comes back into range."""
+        if not self._out_of_range:
+            return
+        _LOGGER.debug("Mower is back in range")
+        self._out_of_range = False
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _get_ble_device(self) -> BLEDevice | None:
+        """Return the BLEDevice of the last connection, or look it up."""
+        return self._ble_device or bluetooth.async_ble_device_from_address(
+            self.hass, self.address, connectable=True
+        )
+
+    def _invalidate_ble_device(self) -> None:
+        """Forget the cached BLEDevice."""
+        self._ble_device = None
+
+    async def _async_connect(self, device: BLEDevice | None) -> bool:
+        """Connect to the mower and negotiate the MTU."""
+        # The previous connection may have gone through an adapter with a
+        # larger MTU, start from the default until this one is known
+        self.mower.MTU_SIZE = DEFAULT_MTU_SIZE
+        if not await self.mower.connect(device):
+            return False
+        self._ble_device = device
+        self._connections += 1
+        await async_negotiate_mtu(self.mower)
+        return True
+
     async def _async_find_device(self):
+        connections = self._connections
+        # Connecting runs request/responses on the shared queue as well
+        async with self._io_lock:
+            if self._connections != connections and self.mower.is_connected():
+                _LOGGER.debug("Reconnected while waiting")
+                return
+            await self._async_reconnect()
+
+    async def _async_reconnect(self):
         _LOGGER.debug("Trying to reconnect")
+        self._invalidate_ble_device()
         await close_stale_connections_by_address(self.address)
 
+        # Only the registry knows whether the mower is in range, BlueZ keeps
+        # the paired device around when it is not
         device = bluetooth.async_ble_device_from_address(
             self.hass, self.address, connectable=True
         )
+
         if not device:
             _LOGGER.error("Can't find device")
             raise UpdateFailed("Can't find device")
 
-        if not await self.mower.connect(device):
+        try:
+            connected = await self._async_connect(device)
+        except (BleakError, TimeoutError) as err:
+            self._invalidate_ble_device()
+            raise UpdateFailed("Failed to connect") from err
+        if not connected:
+            self._invalidate_ble_device()
             raise UpdateFailed("Failed to connect")
 
-    async def _async_update_data(self) -> dict[str, bytes]:
-        """Poll the device."""
-        _LOGGER.debug("Polling device")
+    async def _async_ensure_connected(self) -> bool:
+        """Connect to the mower unless already connected.
 
-        data: dict[str, bytes] = {}
+        Must be called with the I/O lock held, a reconnect in progress reports
+        connected before the channel handshake is done.
+        """
+        if self.mower.is_connected():
+            return True
 
+        device = self._get_ble_device()
+        try:
+            connected = await self._async_connect(device)
+        except (BleakError, TimeoutError):
+            self._invalidate_ble_device()
+            raise
+        if not connected:
+            self._invalidate_ble_device()
+        return connected
+
+    async def async_run_command(
+        self, name: str, command: Callable[[], Awaitable[Any]]
+    ) -> bool:
+        """Send a command to the mower and refresh the data afterwards.
+
+        A command is dropped if the same command is already queued or running,
+        or if another command was requested while it waited for its turn.
+        Returns True if the command was sent.
+        """
+        if self._pending_command == name:
+            _LOGGER.debug("Ignoring repeated %s command", name)
+            return False
+
+        self._pending_command = name
+        # Also covers waiting for the lock, a command cancelled while queued
+        # must not block later presses of the same command
+        try:
+            async with self._command_lock:
+                if self._pending_command != name:
+                    _LOGGER.debug("Dropping superseded %s command", name)
+                    return False
+                # Connect and send under one lock, a poll could disconnect
+                # in between otherwise
+                async with self._io_lock:
+                    if not await self._async_ensure_connected():
+                        return False
+                    await command()
+        finally:
+            if self._pending_command == name:
+                self._pending_command = None
+
+        await self.async_request_refresh()
+        return True
+
+    async def _async_poll_status(
+        self,
+    ) -> MowerData | None:
+        """Read battery level, activity and state in one exchange.
+
+        The protocol has no composite status command, so the three requests
+        are sent back-to-back while holding the I/O lock for the whole batch.
+        Returns None as soon as one of them goes unanswered.
+        """
+        async with self._io_lock:
+            raw_battery_level = await self.mower.battery_level()
+            if raw_battery_level is None:
+                return None
+            battery_level = (
+                raw_battery_level
+                if isinstance(raw_battery_level, int)
+                else int.from_bytes(raw_battery_level, "little")
+            )
+
+            activity = await self.mower.mower_activity()
+            if activity is None:
+                return None
+
+            state = await self.mower.mower_state()
+            if state is None:
+                return None
+
+        return MowerData(battery_level, activity, state)
+
+    async def _async_fetch_status(self) -> MowerData:
+        """Connect if needed and read the mower status."""
         if not self.mower.is_connected():
             await self._async_find_device()
 
         try:
-            data["battery_level"] = await self.mower.battery_level()
-            _LOGGER.debug(data["battery_level"])
-            if data["battery_level"] is None:
-                await self._async_find_device()
-                raise UpdateFailed("Error getting data from device")
-
-            data["activity"] = await self.mower.mower_activity()
-            _LOGGER.debug(data["activity"])
-            if data["activity"] is None:
-                await self._async_find_device()
-                raise UpdateFailed("Error getting data from device")
-
-            data["state"] = await self.mower.mower_state()
-            _LOGGER.debug(data["state"])
-            if data["state"] is None:
-                await self._async_find_device()
-                raise UpdateFailed("Error getting data from device")
-
+            status = await self._async_poll_status()
         except BleakError as err:
             _LOGGER.error("Error getting data from device")
             await self._async_find_device()
             raise UpdateFailed("Error getting data from device") from err
 
-        # Disconnect if parked to force a reconnect next time
-        if data["activity"] == MowerActivity.PARKED and self.mower.is_connected():
-            await self.mower.disconnect()
+        if status is None:
+            # The library drops the connection when the mower stops answering,
+            # an unusable reply on a live link is worth retrying as is
+            if self.mower.is_connected():
+                raise UpdateFailed("Invalid response from device")
+            await self._async_find_device()
+            raise UpdateFailed("Error getting data from device")
+
+        return status
+
+    def _back_off(self) -> None:
+        """Delay the next poll using exponential backoff with full jitter."""
+        ceiling = BACKOFF_INITIAL_DELAY * 2**self._retry_count
+        if ceiling < BACKOFF_MAX_DELAY:
+            self._retry_count += 1
+        delay = random.uniform(0, min(BACKOFF_MAX_DELAY, ceiling))
+        self.update_interval = SCAN_INTERVAL + timedelta(seconds=delay)
+        _LOGGER.debug("Next poll in %s", self.update_interval)
+
+    async def _async_update_data(self) -> MowerData:
+        """Poll the device."""
+        _LOGGER.debug("Polling device")
+
+        try:
+            data = await self._async_fetch_status()
+        except UpdateFailed:
+            self._back_off()
+            raise
+
+        self._retry_count = 0
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "battery=%s activity=%s state=%s",
+                data.battery_level,
+                data.activity,
+                data.state,
+            )
+        activity = data.activity
+
+        # Poll less often while docked, state rarely changes there
+        if activity in (MowerActivity.PARKED, MowerActivity.CHARGING):
+            self.update_interval = DOCKED_SCAN_INTERVAL
+        else:
+            self.update_interval = ACTIVE_SCAN_INTERVAL
+
+        # Disconnect once parked for a while to force a reconnect next time,
+        # keeping the connection warm for commands issued shortly after parking
+        if activity == MowerActivity.PARKED:
+            now = datetime.now()
+            if self._parked_since is None:
+                self._parked_since = now
+            elif now - self._parked_since > PARKED_DISCONNECT_DELAY:
+                async with self._io_lock:
+                    if self.mower.is_connected():
+                        await self.mower.disconnect()
+        else:
+            self._parked_since = None
 
         return data
 
@@ -114,17 +349,28 @@ class HusqvarnaAutomowerBleEntity(CoordinatorEntity[Coordinator]):
     """Coordinator entity for Husqvarna Automower Bluetooth."""
 
     _attr_has_entity_name = True
+    _written_available: bool | None = None
 
     def __init__(self, coordinator: Coordinator, context: Any = None) -> None:
         """Initialize coordinator entity."""
         super().__init__(coordinator, context)
         self._attr_device_info = coordinator.device_info
+        self._mower = coordinator.mower
+
+    @callback
+    def _async_write_ha_state_if_changed(self, changed: bool) -> None:
+        """Write the state if the value or the availability has changed."""
+        available = self.available
+        if not changed and available == self._written_available:
+            return
+        self._written_available = available
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Check if we got a response (self.coordinator.mower.last_response) in the last 5 minutes:
-        if self.coordinator.mower.last_response is not None:
-            if (datetime.now() - self.coordinator.mower.last_response) < timedelta(minutes=5):
+        # Check if we got a response (self._mower.last_response) in the last 5 minutes:
+        if self._mower.last_response is not None:
+            if (datetime.now() - self._mower.last_response) < timedelta(minutes=5):
                 return True
         return False
\ No newline at end of file
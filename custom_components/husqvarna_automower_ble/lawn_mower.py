@@ -6,7 +6,6 @@ import logging
 
 from automower_ble.protocol import MowerState, MowerActivity
 
-from homeassistant.components import bluetooth
 from homeassistant.components.lawn_mower import (
     LawnMowerActivity,
     LawnMowerEntity,
@@ -24,6 +23,58 @@ from .coordinator import Coordinator, HusqvarnaAutomowerBleEntity
 _LOGGER = logging.getLogger(__name__)
 
 
+_ERROR_STATES = frozenset(
+    {
+        MowerState.WAIT_FOR_SAFETYPIN,
+        MowerState.STOPPED,
+        MowerState.FATAL_ERROR,
+        MowerState.ERROR,
+    }
+)
+_ACTIVE_STATES = frozenset(
+    {
+        MowerState.PENDING_START,
+        MowerState.IN_OPERATION,
+        MowerState.RESTRICTED,
+    }
+)
+_DOCKED_ACTIVITIES = frozenset(
+    {
+        MowerActivity.CHARGING,
+        MowerActivity.PARKED,
+    }
+)
+_MOWING_ACTIVITIES = frozenset(
+    {
+        MowerActivity.GOING_OUT,
+        MowerActivity.MOWING,
+        MowerActivity.GOING_HOME,
+    }
+)
+
+
+def _build_activity_map() -> (
+    dict[tuple[MowerState, MowerActivity], LawnMowerActivity]
+):
+    """Map every known (state, activity) pair to a lawn mower activity."""
+    activity_map: dict[tuple[MowerState, MowerActivity], LawnMowerActivity] = {}
+    for state in MowerState:
+        for activity in MowerActivity:
+            if state == MowerState.PAUSED:
+                activity_map[(state, activity)] = LawnMowerActivity.PAUSED
+            elif state in _ERROR_STATES:
+                # This is actually stopped, but that isn't an option
+                activity_map[(state, activity)] = LawnMowerActivity.ERROR
+            elif state in _ACTIVE_STATES and activity in _DOCKED_ACTIVITIES:
+                activity_map[(state, activity)] = LawnMowerActivity.DOCKED
+            elif state in _ACTIVE_STATES and activity in _MOWING_ACTIVITIES:
+                activity_map[(state, activity)] = LawnMowerActivity.MOWING
+    return activity_map
+
+
+_ACTIVITY_MAP = _build_activity_map()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -32,13 +83,13 @@ async def async_setup_entry(
     """Set up AutomowerLawnMower integration from a config entry."""
     coordinator: Coordinator = hass.data[DOMAIN][config_entry.entry_id]
     model = coordinator.model
-    address = coordinator.address
+    base_unique_id = coordinator.base_unique_id
 
     async_add_entities(
         [
             AutomowerLawnMower(
                 coordinator,
-                "automower" + model + "_" + address,
+                base_unique_id,
                 model,
                 LawnMowerEntityFeature.PAUSE
                 | LawnMowerEntityFeature.START_MOWING
@@ -46,7 +97,7 @@ async def async_setup_entry(
             ),
             BatterySensor(
                 coordinator,
-                "automower" + model + "_" + address + "_battery_level",
+                f"{base_unique_id}_battery_level",
                 "Battery Level",
             ),
         ]
@@ -75,67 +126,33 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
         if self.coordinator.data is None:
             return None
 
-        state = self.coordinator.data["state"]
-        activity = self.coordinator.data["activity"]
-
-        if state is None:
-            return None
-
-        if activity is None:
-            return None
-
-        if state == MowerState.PAUSED:
-            return LawnMowerActivity.PAUSED
-        if state in (
-            MowerState.WAIT_FOR_SAFETYPIN,
-            MowerState.STOPPED,
-            MowerState.FATAL_ERROR,
-            MowerState.ERROR,
-        ):
-            # This is actually stopped, but that isn't an option
-            return LawnMowerActivity.ERROR
-        if state in (
-            MowerState.PENDING_START,
-            MowerState.IN_OPERATION,
-            MowerState.RESTRICTED,
-        ):
-            if activity in (
-                MowerActivity.CHARGING,
-                MowerActivity.PARKED,
-            ):
-                return LawnMowerActivity.DOCKED
-            if activity in (
-                MowerActivity.GOING_OUT,
-                MowerActivity.MOWING,
-                MowerActivity.GOING_HOME,
-            ):
-                return LawnMowerActivity.MOWING
-        return LawnMowerActivity.ERROR
+        return _ACTIVITY_MAP.get(
+            (self.coordinator.data.state, self.coordinator.data.activity),
+            LawnMowerActivity.ERROR,
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         _LOGGER.debug("AutomowerLawnMower: _handle_coordinator_update")
 
-        self._attr_activity = self._get_activity()
-        self._attr_available = self._attr_activity is not None
-        self.async_write_ha_state()
+        activity = self._get_activity()
+        changed = activity != self._attr_activity
+        self._attr_activity = activity
+        self._attr_available = activity is not None
+        self._async_write_ha_state_if_changed(changed)
 
     async def async_start_mowing(self) -> None:
         """Start mowing."""
         _LOGGER.debug("Starting mower")
 
-        if not self.coordinator.mower.is_connected():
-            device = bluetooth.async_ble_device_from_address(
-                self.coordinator.hass, self.coordinator.address, connectable=True
-            )
-            if not await self.coordinator.mower.connect(device):
-                return
+        async def start_mowing() -> None:
+            await self.coordinator.mower.mower_resume()
+            if self._attr_activity == LawnMowerActivity.DOCKED:
+                await self.coordinator.mower.mower_override()
 
-        await self.coordinator.mower.mower_resume()
-        if self._attr_activity == LawnMowerActivity.DOCKED:
-            await self.coordinator.mower.mower_override()
-        await self.coordinator.async_request_refresh()
+        if not await self.coordinator.async_run_command("start", start_mowing):
+            return
 
         self._attr_activity = self._get_activity()
         self.async_write_ha_state()
@@ -144,15 +161,10 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
         """Start docking."""
         _LOGGER.debug("Start docking")
 
-        if not self.coordinator.mower.is_connected():
-            device = bluetooth.async_ble_device_from_address(
-                self.coordinator.hass, self.coordinator.address, connectable=True
-            )
-            if not await self.coordinator.mower.connect(device):
-                return
-
-        await self.coordinator.mower.mower_park()
-        await self.coordinator.async_request_refresh()
+        if not await self.coordinator.async_run_command(
+            "dock", self.coordinator.mower.mower_park
+        ):
+            return
 
         self._attr_activity = self._get_activity()
         self.async_write_ha_state()
@@ -161,15 +173,10 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
         """Pause mower."""
         _LOGGER.debug("Pausing mower")
 
-        if not self.coordinator.mower.is_connected():
-            device = bluetooth.async_ble_device_from_address(
-                self.coordinator.hass, self.coordinator.address, connectable=True
-            )
-            if not await self.coordinator.mower.connect(device):
-                return
-
-        await self.coordinator.mower.mower_pause()
-        await self.coordinator.async_request_refresh()
+        if not await self.coordinator.async_run_command(
+            "pause", self.coordinator.mower.mower_pause
+        ):
+            return
 
         self._attr_activity = self._get_activity()
         self.async_write_ha_state()
@@ -197,6 +204,8 @@ class BatterySensor(HusqvarnaAutomowerBleEntity, SensorEntity):
         """Handle updated data from the coordinator."""
         _LOGGER.debug("BatterySensor: _handle_coordinator_update")
 
-        self._attr_native_value = int(self.coordinator.data["battery_level"])
-        self._attr_available = self._attr_native_value is not None
-        self.async_write_ha_state()
+        battery_level = self.coordinator.data.battery_level
+        changed = battery_level != self._attr_native_value
+        self._attr_native_value = battery_level
+        self._attr_available = battery_level is not None
+        self._async_write_ha_state_if_changed(changed)
@@ -0,0 +1 @@
+"""Tests for the Husqvarna Automower Bluetooth integration."""
@@ -0,0 +1,213 @@
+"""Test the Husqvarna Automower Bluetooth coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from automower_ble.protocol import MowerActivity, MowerState
+from bleak import BleakError
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.husqvarna_automower_ble.coordinator import (
+    SCAN_INTERVAL,
+    Coordinator,
+)
+
+ADDRESS = "00:11:22:33:44:55"
+
+
+def _create_coordinator(hass: HomeAssistant, mower: MagicMock) -> Coordinator:
+    """Create a coordinator for a mock mower."""
+    return Coordinator(
+        hass, logging.getLogger(__name__), mower, ADDRESS, 1234, "Automower"
+    )
+
+
+def _patch_bluetooth():
+    """Patch the device lookup and stale connection cleanup."""
+    return (
+        patch(
+            "custom_components.husqvarna_automower_ble.coordinator."
+            "close_stale_connections_by_address",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "custom_components.husqvarna_automower_ble.coordinator."
+            "bluetooth.async_ble_device_from_address",
+            return_value=MagicMock(),
+        ),
+    )
+
+
+@pytest.mark.parametrize("error", [BleakError("No backend"), TimeoutError()])
+async def test_reconnect_error_backs_off(
+    hass: HomeAssistant, error: Exception
+) -> None:
+    """Test a reconnect that raises is reported as a failed update and backs off."""
+    mower = MagicMock()
+    mower.is_connected.return_value = False
+    mower.connect = AsyncMock(side_effect=error)
+    coordinator = _create_coordinator(hass, mower)
+
+    stale_patch, lookup_patch = _patch_bluetooth()
+    with stale_patch, lookup_patch:
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator._retry_count == 1
+    assert coordinator.update_interval > SCAN_INTERVAL
+
+
+async def test_command_waits_for_reconnect(hass: HomeAssistant) -> None:
+    """Test a command issued during a reconnect waits for the handshake."""
+    handshake = asyncio.Event()
+    connected = False
+
+    async def connect(device) -> bool:
+        nonlocal connected
+        # The link is up before the channel handshake has finished
+        connected = True
+        await handshake.wait()
+        return True
+
+    mower = MagicMock()
+    mower.is_connected.side_effect = lambda: connected
+    mower.connect = AsyncMock(side_effect=connect)
+    coordinator = _create_coordinator(hass, mower)
+
+    coordinator.async_request_refresh = AsyncMock()
+    command = AsyncMock()
+
+    stale_patch, lookup_patch = _patch_bluetooth()
+    with stale_patch, lookup_patch:
+        reconnect = hass.async_create_task(coordinator._async_find_device())
+        await asyncio.sleep(0)
+        run_command = hass.async_create_task(
+            coordinator.async_run_command("start", command)
+        )
+        await asyncio.sleep(0)
+        command.assert_not_awaited()
+
+        handshake.set()
+        await reconnect
+        assert await run_command
+
+    command.assert_awaited_once()
+    assert mower.connect.call_count == 1
+
+
+async def test_cancelled_queued_command(hass: HomeAssistant) -> None:
+    """Test a command cancelled while queued does not block later presses."""
+    mower = MagicMock()
+    mower.is_connected.return_value = True
+    coordinator = _create_coordinator(hass, mower)
+    coordinator.async_request_refresh = AsyncMock()
+
+    docking = asyncio.Event()
+    dock = hass.async_create_task(
+        coordinator.async_run_command("dock", docking.wait)
+    )
+    await asyncio.sleep(0)
+    start = hass.async_create_task(
+        coordinator.async_run_command("start", AsyncMock())
+    )
+    await asyncio.sleep(0)
+
+    start.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await start
+    docking.set()
+    assert await dock
+
+    command = AsyncMock()
+    assert await coordinator.async_run_command("start", command)
+    command.assert_awaited_once()
+
+
+async def test_repeated_and_superseded_commands(hass: HomeAssistant) -> None:
+    """Test repeated commands are ignored and superseded ones dropped."""
+    mower = MagicMock()
+    mower.is_connected.return_value = True
+    coordinator = _create_coordinator(hass, mower)
+    coordinator.async_request_refresh = AsyncMock()
+
+    docking = asyncio.Event()
+    dock = hass.async_create_task(
+        coordinator.async_run_command("dock", docking.wait)
+    )
+    await asyncio.sleep(0)
+    start_command = AsyncMock()
+    start = hass.async_create_task(
+        coordinator.async_run_command("start", start_command)
+    )
+    await asyncio.sleep(0)
+
+    # Repeated while queued, then superseded by pause
+    assert not await coordinator.async_run_command("start", AsyncMock())
+    pause_command = AsyncMock()
+    pause = hass.async_create_task(
+        coordinator.async_run_command("pause", pause_command)
+    )
+    await asyncio.sleep(0)
+
+    docking.set()
+    assert await dock
+    assert not await start
+    assert await pause
+    start_command.assert_not_awaited()
+    pause_command.assert_awaited_once()
+    assert coordinator.async_request_refresh.await_count == 2
+
+
+async def test_command_waits_for_parked_disconnect(hass: HomeAssistant) -> None:
+    """Test a command issued during the parked disconnect reconnects first."""
+    disconnecting = asyncio.Event()
+    connected = True
+
+    async def disconnect() -> None:
+        nonlocal connected
+        # The link only reports disconnected once the teardown is done
+        await disconnecting.wait()
+        connected = False
+
+    async def connect(device) -> bool:
+        nonlocal connected
+        connected = True
+        return True
+
+    mower = MagicMock()
+    mower.is_connected.side_effect = lambda: connected
+    mower.disconnect = AsyncMock(side_effect=disconnect)
+    mower.connect = AsyncMock(side_effect=connect)
+    mower.battery_level = AsyncMock(return_value=100)
+    mower.mower_activity = AsyncMock(return_value=MowerActivity.PARKED)
+    mower.mower_state = AsyncMock(return_value=MowerState.IN_OPERATION)
+    coordinator = _create_coordinator(hass, mower)
+    coordinator._parked_since = datetime.now() - timedelta(hours=1)
+    coordinator.async_request_refresh = AsyncMock()
+    command = AsyncMock()
+
+    with patch(
+        "custom_components.husqvarna_automower_ble.coordinator."
+        "bluetooth.async_ble_device_from_address",
+        return_value=MagicMock(),
+    ):
+        poll = hass.async_create_task(coordinator._async_update_data())
+        await asyncio.sleep(0)
+        run_command = hass.async_create_task(
+            coordinator.async_run_command("start", command)
+        )
+        await asyncio.sleep(0)
+        command.assert_not_awaited()
+
+        disconnecting.set()
+        await poll
+        assert await run_command
+
+    mower.connect.assert_awaited_once()
+    command.assert_awaited_once()